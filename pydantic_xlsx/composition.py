@@ -19,19 +19,26 @@ This can be one of the following cases:
 
 from abc import ABCMeta, abstractmethod
 from enum import Enum
+from functools import lru_cache
 import math
-from typing import Any, Dict, List, Type, TYPE_CHECKING
+from typing import (
+    Any, Dict, Iterator, List, Optional, Tuple, Type, TYPE_CHECKING, Union
+)
 
-from openpyxl import Workbook
-from openpyxl import utils as pyxl_utils
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.worksheet.table import Table
+from pydantic.fields import ModelField
+from pydantic.utils import lenient_issubclass
 
 from .config import XlsxConfig
 from .fields import FieldTypeInfoFactory
 
 if TYPE_CHECKING:
+    from openpyxl import Workbook
     from .model import XlsxModel
 
 EXCEL_MAX_ROWS = 1048576
@@ -69,6 +76,9 @@ True.".format(title))
         self.data = data
         self.title = title
         self.config = config
+        self._num_cols = len(data[0].__fields__)
+        self._end_col_letter = get_column_letter(self._num_cols)
+        self._display_name = title.replace(" ", "")
 
     @classmethod
     @abstractmethod
@@ -83,45 +93,124 @@ True.".format(title))
     def workbook_to_model(
         cls,
         model: Type["XlsxModel"],
-        wb: Workbook,
+        wb: "Workbook",
     ) -> "XlsxModel":
         """
         Takes a openpyxl Workbook and parses it to a `XlsxModel`.
         """
         pass
 
+    @staticmethod
+    def _worksheet_entries(
+        ws: Worksheet,
+        model: Type["XlsxModel"],
+        by_field_name: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Reads the content rows of a worksheet as dicts keyed by the header
+        (first row). Columns which should be ignored by the given model are
+        skipped. As the header contains the aliases of the fields,
+        `by_field_name` can be used to key the dicts by the field names
+        instead (needed by pydantic's `construct`).
+        """
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, ())
+        columns = [
+            (index, key) for index, key in enumerate(header)
+            if not model._ignore_key(key)
+        ]
+        if by_field_name:
+            names = {
+                field.alias: name for name, field in model.__fields__.items()
+            }
+            columns = [(index, names.get(key, key)) for index, key in columns]
+        for row in rows:
+            yield {key: row[index] for index, key in columns}
+
     def populate_worksheet(self, ws: Worksheet):
         """
         Populates a given Excel worksheet with data and title.
         """
         ws.title = self.title
-        self.__worksheet_insert_header(ws)
-        self.__worksheet_insert_content(ws)
+        rows = [entry._row_values() for entry in self.data]
+        styles = [
+            self.__column_style(field)
+            for field in self.data[0].__fields__.values()
+        ]
+        # Write-only worksheets serialize each row as soon as it's appended,
+        # thus everything concerning columns and the sheet view has to be
+        # configured before the first row is inserted.
         self.__freeze_cells(ws)
-        self.__apply_apperance(ws)
+        self.__apply_apperance(ws, rows, styles)
         self.__apply_print_settings(ws)
+        self.__worksheet_insert_header(ws)
+        self.__worksheet_insert_content(ws, rows, styles)
         self.__data_table(ws)
 
     def __worksheet_insert_header(self, ws: Worksheet) -> None:
-        """Sets and formats the header of the Worksheet."""
-        header_row = ws.row_dimensions[1]
-        if (font := self.config.header_font) is not None:
-            header_row.font = font
-        if (alignment := self.config.header_alignment) is not None:
-            header_row.alignment = alignment
-        ws.append(self.data[0]._property_keys())
-
-    def __worksheet_insert_content(self, ws: Worksheet) -> None:
-        """Inserts the actual data into the Worksheet."""
-        for row in self.data:
-            ws.append([cell for cell in row.dict().values()])
+        """
+        Sets and formats the header of the Worksheet. The style has to be
+        applied to the cells themselves as Excel doesn't propagate the style
+        of a row to cells with content.
+        """
+        font = self.config.header_font
+        alignment = self.config.header_alignment
+        header: List[Cell] = []
+        for key in self.data[0]._property_keys():
+            cell = WriteOnlyCell(ws, value=key)
+            if font is not None:
+                cell.font = font
+            if alignment is not None:
+                cell.alignment = alignment
+            header.append(cell)
+        ws.append(header)
+
+    def __worksheet_insert_content(
+            self,
+            ws: Worksheet,
+            rows: List[Tuple[Any, ...]],
+            styles: List[Tuple[Optional[Font], Optional[str]]],
+    ) -> None:
+        """
+        Inserts the actual data into the Worksheet. Cells with content don't
+        inherit the style of their column, thus the values of styled columns
+        are inserted as pre-styled cells. The style of each column is resolved
+        once on a template cell and then copied to the cells.
+        """
+        templates: List[Optional[Cell]] = []
+        for font, number_format in styles:
+            if font is None and number_format is None:
+                templates.append(None)
+                continue
+            template = WriteOnlyCell(ws)
+            if font is not None:
+                template.font = font
+            if number_format is not None:
+                template.number_format = number_format
+            templates.append(template)
+
+        if all(template is None for template in templates):
+            for row in rows:
+                ws.append(row)
+            return
+        for row in rows:
+            ws.append([
+                value if template is None
+                else Cell(ws, value=value, style_array=template._style)
+                for value, template in zip(row, templates)
+            ])
 
     def __freeze_cells(self, ws: Worksheet) -> None:
         """Freezes the cell at the given cell from the config."""
         if (freeze_at := self.config.freeze_cell) is not None:
-            ws.freeze_panes = ws[freeze_at]
+            ws.freeze_panes = freeze_at
 
-    def __apply_apperance(self, ws: Worksheet) -> None:
+    def __apply_apperance(
+            self,
+            ws: Worksheet,
+            rows: List[Tuple[Any, ...]],
+            styles: List[Tuple[Optional[Font], Optional[str]]],
+    ) -> None:
         """
         Apply column-specific formatting. Formatting settings from specific
         rows (as defined by `.XlsxField`) will be preferred over document wide
@@ -131,46 +220,71 @@ True.".format(title))
         by a `.XlsxField` in the model.
         """
         fields = list(self.data[0].__fields__.values())
-        lengths = self.__calc_column_widths()
+        lengths = self.__calc_column_widths(rows)
+        enum_validators: Dict[Type[Enum], DataValidation] = {}
+        if (dv_rows := self.config.data_validation_rows) is None:
+            dv_rows = EXCEL_MAX_ROWS
+        # The validation has to cover at least the header and the data rows
+        # but can't exceed the rows available in a sheet.
+        dv_rows = min(max(dv_rows, len(self.data) + 1), EXCEL_MAX_ROWS)
+        letters = [
+            get_column_letter(col) for col in range(1, self._num_cols+1)
+        ]
+
+        for column_letter, field, (font, number_format), width in zip(
+                letters, fields, styles, lengths):
+            is_enum = issubclass(field.type_, Enum)
+            # Columns using the defaults don't need a column dimension at all.
+            if not is_enum and font is None and number_format is None and \
+                    width is None:
+                continue
+            column = ws.column_dimensions[column_letter]
+
+            # Apply List DataValidation to column. Columns of the same Enum
+            # share one validator.
+            if is_enum:
+                if (dv := enum_validators.get(field.type_)) is None:
+                    dv = self.__validator_for_enum(field.type_)
+                    ws.data_validations.append(dv)
+                    enum_validators[field.type_] = dv
+                dv.add(f"{column_letter}1:{column_letter}{dv_rows}")
+
+            if font is not None:
+                column.font = font
+            if number_format is not None:
+                column.number_format = number_format
+            if width is not None:
+                column.width = width
+
+    def __column_style(
+            self,
+            field: ModelField,
+    ) -> Tuple[Optional[Font], Optional[str]]:
+        """
+        Resolves the font and number format of the column for the given field
+        according to the priorities described in `__apply_apperance`.
+        """
+        field_info = field.field_info
+        field_type_info = FieldTypeInfoFactory.field_info_from_type(
+            field.type_
+        )
 
-        # TODO: Refactoring this beast.
+        # 1st font priority: XlsxField.
+        font = getattr(field_info, "font", None)
+        # 2nd font priority: Derived from FieldTypeInfo.
+        if font is None:
+            font = getattr(field_type_info, "font", None)
+        # 3rd font priority: Document wide setting.
+        if font is None:
+            font = self.config.font
 
-        for col in range(1, ws.max_column+1):
-            column_letter = pyxl_utils.cell.get_column_letter(col)
-            column = ws.column_dimensions[column_letter]
-            field_info = fields[col-1].field_info
-            field_type_info = FieldTypeInfoFactory.field_info_from_type(
-                fields[col-1].type_
-            )
+        # 1st number format priority: XlsxField.
+        number_format = getattr(field_info, "number_format", None)
+        # 2nd number format priority: Derived from FieldTypeInfo.
+        if number_format is None:
+            number_format = getattr(field_type_info, "number_format", None)
 
-            # Apply List DataValidation to column.
-            if issubclass(fields[col-1].type_, Enum):
-                dv = self.__validator_for_enum(fields[col-1].type_)
-                ws.add_data_validation(dv)
-                dv.add(f"{column_letter}1:{column_letter}{EXCEL_MAX_ROWS}")
-
-            # 1st font priority: XlsxField.
-            if hasattr(field_info, "font") and \
-                    field_info.font is not None:
-                column.font = field_info.font
-            # 2nd font priority: Derived from FieldTypeInfo.
-            elif hasattr(field_type_info, "font") and \
-                    field_type_info.font is not None:
-                column.font = field_info.font
-            # 3rd font priority: Document wide setting.
-            elif self.config.font is not None:
-                column.font = self.config.font
-
-            # 1st number format priority: XlsxField.
-            if hasattr(field_info, "number_format") and \
-                    field_info.number_format is not None:
-                column.number_format = field_info.number_format
-            # 2nd number format priority: Derived from FieldTypeInfo.
-            elif hasattr(field_type_info, "number_format") and \
-                    field_type_info.number_format is not None:
-                column.number_format = field_type_info.number_format
-
-            column.width = lengths[col-1]
+        return font, number_format
 
     def __apply_print_settings(self, ws: Worksheet) -> None:
         """Applies the print settings."""
@@ -184,40 +298,42 @@ True.".format(title))
     def __data_table(self, ws: Worksheet) -> None:
         """Configures the data table."""
         table = Table(
-            displayName=self.title.replace(" ", ""),
+            displayName=self._display_name,
             ref=self.__dimensions()
         )
-        ws.add_table(table)
+        if not self.config.write_only:
+            ws.add_table(table)
+            return
+        # In write-only mode openpyxl can't read the column names back from
+        # the header cells, they have to be set on the table manually.
+        table._initialise_columns()
+        keys = self.data[0]._property_keys()
+        for column, key in zip(table.tableColumns, keys):
+            column.name = key
+        ws.tables.add(table)
 
     def __dimensions(self) -> str:
         """Returns the dimension of the used space."""
-        return "A1:{col}{row}".format(
-            col=pyxl_utils.cell.get_column_letter(
-                len(self.data[0].__fields__)),
-            row=len(self.data) + 1,
-        )
+        return f"A1:{self._end_col_letter}{len(self.data) + 1}"
 
-    def __calc_column_widths(self) -> List[int]:
-        """Calculates an approximative width for each column."""
-        widths_per_key: Dict[str, int] = {}
-        keys = [key for key in self.data[0].__fields__]
-        for key in keys:
-            widths_per_key[key] = 0
-
-        for entry in self.data:
-            entry_dict = entry.dict()
-            for key in keys:
-                if not isinstance(entry_dict[key], str):
-                    continue
-                if (length := len(entry_dict[key])) > widths_per_key[key]:
-                    widths_per_key[key] = length
-        rsl: List[int] = []
-        for value in widths_per_key.values():
-            if (length := math.ceil(value*0.93)) > 5:
-                rsl.append(length)
-            else:
-                rsl.append(5)
-        return rsl
+    def __calc_column_widths(
+            self,
+            rows: List[Tuple[Any, ...]],
+    ) -> List[Optional[int]]:
+        """
+        Calculates an approximative width for each column. Returns `None` for
+        all columns if `XlsxConfig.disable_width_calculation` is set.
+        """
+        if self.config.disable_width_calculation:
+            return [None] * self._num_cols
+        widths = [
+            max(
+                (len(value) for value in column if isinstance(value, str)),
+                default=0,
+            )
+            for column in zip(*rows)
+        ]
+        return [max(5, math.ceil(width*0.93)) for width in widths]
 
     @staticmethod
     def __validator_for_enum(enum: Enum) -> DataValidation:
@@ -262,16 +378,13 @@ class SingleModelComposition(Composition):
     def workbook_to_model(
         cls,
         model: Type["XlsxModel"],
-        wb: Workbook,
+        wb: "Workbook",
     ) -> "XlsxModel":
-        ws = wb.active
-        entry: Dict[str, Any] = {}
-        for column in range(1, ws.max_column+1):
-            key = ws.cell(row=1, column=column).value
-            if model._ignore_key(key):
-                continue
-            entry[key] = ws.cell(row=2, column=column).value
-        return model.parse_obj(entry)
+        if model.__config__.trust_input:
+            entries = cls._worksheet_entries(wb.active, model, True)
+            return model.construct(**next(entries, {}))
+        entries = cls._worksheet_entries(wb.active, model)
+        return model.parse_obj(next(entries, {}))
 
 
 class RootCollectionComposition(Composition):
@@ -296,20 +409,17 @@ class RootCollectionComposition(Composition):
     def workbook_to_model(
         cls,
         model: Type["XlsxModel"],
-        wb: Workbook,
+        wb: "Workbook",
     ) -> "XlsxModel":
-        ws = wb.active
-
-        data: List[Dict[str, Any]] = []
-        for row in range(2, ws.max_row + 1):
-            entry: Dict[str, Any] = {}
-            for column in range(1, ws.max_column+1):
-                key = ws.cell(row=1, column=column).value
-                if model._ignore_key(key):
-                    continue
-                entry[key] = ws.cell(row=row, column=column).value
-            data.append(entry)
-        return model.parse_obj(data)
+        # pydantic validates generators item by item for list fields, thus
+        # the dict of each row only lives until it's validated.
+        item_model = model.__fields__["__root__"].type_
+        if model.__config__.trust_input:
+            entries = cls._worksheet_entries(wb.active, item_model, True)
+            return model.construct(
+                __root__=[item_model.construct(**entry) for entry in entries]
+            )
+        return model.parse_obj(cls._worksheet_entries(wb.active, item_model))
 
 
 class CollectionComposition(Composition):
@@ -335,22 +445,22 @@ class CollectionComposition(Composition):
     def workbook_to_model(
         cls,
         model: Type["XlsxModel"],
-        wb: Workbook,
+        wb: "Workbook",
     ) -> "XlsxModel":
-        data: Dict[str, List[Dict[str, Any]]] = {}
+        if model.__config__.trust_input:
+            fields: Dict[str, List["XlsxModel"]] = {}
+            for name, prop in model.__fields__.items():
+                entries = cls._worksheet_entries(
+                    wb[prop.alias], prop.type_, True
+                )
+                fields[name] = [prop.type_.construct(**e) for e in entries]
+            return model.construct(**fields)
 
+        data: Dict[str, Iterator[Dict[str, Any]]] = {}
         for prop in model.__fields__.values():
-            ws = wb[prop.alias]
-            data[prop.alias] = []
-            current_model = model.__fields__[prop.alias].type_
-            for row in range(2, ws.max_row+1):
-                entry: Dict[str, Any] = {}
-                for column in range(1, ws.max_column+1):
-                    key = ws.cell(row=1, column=column).value
-                    if current_model._ignore_key(key):
-                        continue
-                    entry[key] = ws.cell(row=row, column=column).value
-                data[prop.alias].append(entry)
+            data[prop.alias] = cls._worksheet_entries(
+                wb[prop.alias], prop.type_
+            )
         return model.parse_obj(data)
 
 
@@ -361,24 +471,37 @@ class CompositionFactory:
     """
 
     @classmethod
-    def from_model(cls, model: "XlsxModel") -> Composition:
+    def from_model(
+        cls,
+        model: Union["XlsxModel", Type["XlsxModel"]],
+    ) -> Type[Composition]:
         """
-        Creates and returns the correct `Composition` implementation for the
-        given Model.
+        Returns the correct `Composition` implementation for the given Model
+        (either an instance or the class itself).
         """
+        if not isinstance(model, type):
+            model = type(model)
+        return cls.__from_model_class(model)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __from_model_class(model: Type["XlsxModel"]) -> Type[Composition]:
+        """
+        Determines the `Composition` implementation for a model class. The
+        structure of a model class doesn't change thus the result is cached.
+        """
+        # Imported here as the model module depends on this module.
+        from .model import XlsxModel
+
         contains_list_of_models = False
 
         for key, prop in model.__fields__.items():
             typ = getattr(prop.outer_type_, "__origin__", None)
 
-            # Thanks to Python's inability to handle cyclic imports checking if
-            # the type is XlsxModel is done with this handy string hack.
-            bases = [base.__name__ for base in prop.type_.__bases__]
-            if typ is not None and \
-                    issubclass(typ, List) and \
-                    "XlsxModel" in bases:
+            if lenient_issubclass(typ, list) and \
+                    lenient_issubclass(prop.type_, XlsxModel):
                 contains_list_of_models = True
-            elif typ is not None and issubclass(typ, Dict):
+            elif lenient_issubclass(typ, dict):
                 raise TypeError("Dicts currently not supported")
 
         # If __root__ is present as a parameter in a model pydantic forbids any
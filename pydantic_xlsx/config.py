@@ -2,6 +2,7 @@
 Provides additional configuration capabilities for the `model.XlsxModel`.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 from openpyxl.styles import Alignment, Font
@@ -45,10 +46,35 @@ class XlsxConfig(BaseConfig):
     will otherwise lead to an validation error of pydantic. Use this option
     with caution.
     """
+    trust_input: bool = False
+    """
+    Skip pydantic's validation when importing data from a xlsx file. The cell
+    values are used as they are read by openpyxl (via `BaseModel.construct`),
+    missing fields are populated with their default values. Only enable this
+    option for files you fully trust, no type conversion (e.g. to
+    `.types.Money`) takes place.
+    """
     disable_width_calculation: bool = False
     """
     The library uses a primitive algorithm to set the width for each column
-    based on number of chars of the longest cell content.
+    based on number of chars of the longest cell content. Set this option to
+    true to skip this calculation and keep Excel's default column width.
+    """
+    write_only: bool = False
+    """
+    Export the data using openpyxl's write-only mode. The rows are streamed
+    into the file instead of building up the whole sheet in memory which
+    speeds up the export of large models considerably. Note that the Workbook
+    returned by `XlsxModel.workbook` can only be saved (once) and not be
+    inspected or altered anymore when this option is enabled.
+    """
+    data_validation_rows: Optional[int] = None
+    """
+    Number of rows (including the header) the drop-down validation of Enum
+    columns is applied to. Defaults to `None` which applies the validation to
+    the whole column. When set, the rows are extended if there is more data.
+    Rows added later on in Excel beyond this limit won't be validated. Values
+    above Excel's maximum of 1048576 rows are capped to the whole column.
     """
     print_horizontal_centered: bool = True
     """
@@ -78,25 +104,43 @@ class XlsxConfig(BaseConfig):
 
     @classmethod
     def _print_title_columns(cls) -> Optional[str]:
-        if cls.freeze_cell is None:
-            return None
-        freeze_column =\
-            pyxl_utils.cell.coordinate_from_string(cls.freeze_cell)[0]
-        max_column_num =\
-            pyxl_utils.cell.column_index_from_string(freeze_column) - 1
-        if max_column_num == 0:
-            return None
-        max_column = pyxl_utils.cell.get_column_letter(max_column_num)
-        return f"A:{max_column}"
+        if cls.print_title_columns is not None:
+            return cls.print_title_columns or None
+        return _title_columns_from_cell(cls.freeze_cell)
 
     @classmethod
     def _print_title_rows(cls) -> Optional[str]:
         if cls.print_title_rows is not None:
-            return cls.print_title_rows
-        if cls.freeze_cell is None:
-            return None
-        freeze_row =\
-            pyxl_utils.cell.coordinate_from_string(cls.freeze_cell)[1] - 1
-        if freeze_row == 0:
-            return None
-        return f"1:{freeze_row}"
+            return cls.print_title_rows or None
+        return _title_rows_from_cell(cls.freeze_cell)
+
+
+@lru_cache(maxsize=None)
+def _title_columns_from_cell(freeze_cell: Optional[str]) -> Optional[str]:
+    """
+    Derives the print title columns from the freeze cell. The result is cached
+    as the configuration of a model doesn't change.
+    """
+    if freeze_cell is None:
+        return None
+    freeze_column = pyxl_utils.cell.coordinate_from_string(freeze_cell)[0]
+    max_column_num =\
+        pyxl_utils.cell.column_index_from_string(freeze_column) - 1
+    if max_column_num == 0:
+        return None
+    max_column = pyxl_utils.cell.get_column_letter(max_column_num)
+    return f"A:{max_column}"
+
+
+@lru_cache(maxsize=None)
+def _title_rows_from_cell(freeze_cell: Optional[str]) -> Optional[str]:
+    """
+    Derives the print title rows from the freeze cell. The result is cached as
+    the configuration of a model doesn't change.
+    """
+    if freeze_cell is None:
+        return None
+    freeze_row = pyxl_utils.cell.coordinate_from_string(freeze_cell)[1] - 1
+    if freeze_row == 0:
+        return None
+    return f"1:{freeze_row}"
@@ -3,6 +3,7 @@ Extends pydantic's fields with some extra functionality.
 """
 
 from abc import ABCMeta, abstractmethod
+from functools import lru_cache
 from typing import Any, Generic, Optional, Type, TypeVar
 
 from openpyxl.styles import Font
@@ -79,9 +80,11 @@ class FieldTypeInfoFactory:
     """
 
     @classmethod
+    @lru_cache(maxsize=None)
     def from_field_type(cls, field_type: Type[T]) -> Optional[FieldTypeInfo]:
         """
-        Creates and returns the correct `FieldTypeInfo` for a given type.
+        Creates and returns the correct `FieldTypeInfo` for a given type. The
+        result is cached per type.
         """
         if issubclass(field_type, Money):
             return MoneyFieldInfo(field_type)
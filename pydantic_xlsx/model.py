@@ -2,16 +2,25 @@
 Provides the `XlsxModel` to the library user.
 """
 
+from enum import Enum
 from pathlib import Path
-from typing import Any, List, Optional, Type, Union
+from typing import Any, Callable, FrozenSet, Optional, Tuple, Type, Union
 
 from openpyxl import load_workbook, Workbook
 from pydantic import BaseModel
+from pydantic.utils import lenient_issubclass
 
 from .composition import CompositionFactory
 from .config import XlsxConfig
 
 
+def _enum_value(value: Any) -> Any:
+    """Returns the value of Enum members, other values are passed through."""
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
 class XlsxModel(BaseModel):
     """
     Extends pydantic with the ability to in- and export data from/to xlsx
@@ -43,10 +52,12 @@ class XlsxModel(BaseModel):
 
     def workbook(self) -> Workbook:
         """Returns a openpyxl Workbook."""
-        wb = Workbook()
+        write_only = self.__config__.write_only
+        wb = Workbook(write_only=write_only)
         sheets = CompositionFactory.from_model(self).sheets_from_model(self)
 
-        first_sheet = True
+        # Write-only workbooks don't come with an initial active sheet.
+        first_sheet = not write_only
         for sheet in sheets:
             if first_sheet:
                 ws = wb.active
@@ -62,9 +73,56 @@ class XlsxModel(BaseModel):
         wb.save(path)
 
     @classmethod
-    def _property_keys(cls) -> List[str]:
-        """Returns the names of the properties used in the excel header."""
-        return [field.alias for field in cls.__fields__.values()]
+    def _property_keys(cls) -> Tuple[str, ...]:
+        """
+        Returns the names of the properties used in the excel header. The
+        result is cached on the model class.
+        """
+        if (keys := cls.__dict__.get("_property_keys_cache")) is None:
+            keys = tuple(field.alias for field in cls.__fields__.values())
+            cls._property_keys_cache = keys
+        return keys
+
+    def _row_values(self) -> Tuple[Any, ...]:
+        """
+        Returns the values of the fields (in the order of the header) as they
+        are written into the cells of a row.
+        """
+        values = self.__dict__
+        return tuple(
+            values[name] if converter is None else converter(values[name])
+            for name, converter in self._row_converters()
+        )
+
+    @classmethod
+    def _row_converters(
+            cls,
+    ) -> Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]:
+        """
+        Returns the name of each field along with the function converting its
+        value into a cell value (`None` if the value can be used as it is).
+        Enum members are stored by their value as this is what the drop-down
+        of Enum columns offers. The result is cached on the model class.
+        """
+        if (converters := cls.__dict__.get("_row_converters_cache")) is None:
+            converters = tuple(
+                (name, _enum_value if lenient_issubclass(field.type_, Enum)
+                 else None)
+                for name, field in cls.__fields__.items()
+            )
+            cls._row_converters_cache = converters
+        return converters
+
+    @classmethod
+    def _allowed_keys(cls) -> FrozenSet[str]:
+        """
+        Same as `_property_keys` but as a (cached) set for fast membership
+        tests.
+        """
+        if (keys := cls.__dict__.get("_allowed_keys_cache")) is None:
+            keys = frozenset(cls._property_keys())
+            cls._allowed_keys_cache = keys
+        return keys
 
     @classmethod
     def _ignore_key(cls, key: Optional[str]) -> bool:
@@ -79,4 +137,4 @@ class XlsxModel(BaseModel):
             return False
         if key is None:
             return True
-        return key not in cls._property_keys()
+        return key not in cls._allowed_keys()
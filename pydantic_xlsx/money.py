@@ -7,6 +7,7 @@ from .types import Money
 
 class Euro(Money):
     """Definition for Euro."""
+    __slots__ = ()
     minor_unit = 2
     code = "€"
     code_before_amount = False
@@ -16,6 +17,7 @@ class Euro(Money):
 
 class SwissFranc(Money):
     """Defines Swiss franc."""
+    __slots__ = ()
     minor_unit = 2
     code = "CHF"
     code_before_amount = False
@@ -25,6 +27,7 @@ class SwissFranc(Money):
 
 class UnitedStatesDollar(Money):
     """Defines United States dollar."""
+    __slots__ = ()
     minor_unit = 2
     code = "$"
     code_before_amount = False
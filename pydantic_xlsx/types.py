@@ -3,11 +3,21 @@ This module contains additional data types which are important when working
 with Excel data sources like a primitive Money type.
 """
 
-from abc import ABCMeta, abstractmethod
-from typing import Optional
+import math
+from typing import ClassVar, Dict, Iterable, List, Optional
 
 
-class Money(float, metaclass=ABCMeta):
+_CURRENCY_ATTRIBUTES = (
+    "minor_unit",
+    "code",
+    "code_before_amount",
+    "delimiter",
+    "thousands_separator",
+)
+"""Class variables each `Money` subclass has to define."""
+
+
+class Money(float):
     """
     Handles amounts of money by subclassing float. In general it's a very bad
     idea to store amounts of money as floats as all kind of funny things can
@@ -19,109 +29,176 @@ class Money(float, metaclass=ABCMeta):
     minor units of the given currency and then converted to an integer.
 
     To define a money field in your model you first have to define the currency
-    you like to use. For this subclass the Money class and set some class
-    variables:
+    you like to use. For this subclass the Money class and set all of the
+    following class variables (a `TypeError` is raised otherwise):
 
     ```
     class Euro(Money):
+        __slots__ = ()
         minor_unit = 2
         code = "€"
         code_before_amount = False
         delimiter = ","
         thousands_separator = "."
     ```
+
+    Instances only store the amount (see `__slots__`). Declare an empty
+    `__slots__` in your currency as shown above, otherwise each instance gets a
+    `__dict__` again.
     """
 
+    __slots__ = ("amount",)
+
     amount: int
     """The amount of money."""
 
-    @property
-    @classmethod
-    @abstractmethod
-    def minor_unit(cls) -> int:
-        """
-        Expresses the decimal relationship between the currency and it's minor
-        unit. 1 means a ratio of 10:1, 2 equals to 100:1 and so on. For example
-        the European currency "Euro" has a minor unit 2 as one Euro is made up
-        of 100 cents.
-        """
-        pass
+    minor_unit: ClassVar[int]
+    """
+    Expresses the decimal relationship between the currency and it's minor
+    unit. 1 means a ratio of 10:1, 2 equals to 100:1 and so on. For example
+    the European currency "Euro" has a minor unit 2 as one Euro is made up
+    of 100 cents.
+    """
+    code: ClassVar[str]
+    """Freely chosen code to represent your currency."""
+    code_before_amount: ClassVar[bool]
+    """The position of the currency code."""
+    delimiter: ClassVar[str]
+    """
+    Delimiter used to distinguish between the currency and it's minor unit.
+    """
+    thousands_separator: ClassVar[str]
+    """
+    Separator used to group thousands.
+    """
 
-    @property
-    @classmethod
-    @abstractmethod
-    def code(cls) -> str:
-        """Freely chosen code to represent your currency."""
-        pass
+    _scale: ClassVar[int]
+    """Factor between the currency and it's minor unit (`10 ** minor_unit`)."""
+    _exact_limit: ClassVar[float]
+    """
+    Values below this magnitude can be rounded arithmetically without losing
+    precision (`2 ** 50 / _scale`).
+    """
+    _minor_fmt: ClassVar[str]
+    """Format string for the zero padded minor unit part of the amount."""
+    _thousands_trans: ClassVar[Dict[int, str]]
+    """Translation table replacing `,` with the thousands separator."""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        missing = [
+            name for name in _CURRENCY_ATTRIBUTES if not hasattr(cls, name)
+        ]
+        if missing:
+            raise TypeError("currency {} doesn't define {}".format(
+                cls.__name__, ", ".join(missing)
+            ))
+        cls._scale = 10 ** cls.minor_unit
+        cls._exact_limit = 2 ** 50 / cls._scale
+        cls._minor_fmt = "{:0%dd}" % cls.minor_unit
+        cls._thousands_trans = str.maketrans({",": cls.thousands_separator})
 
-    @property
-    @classmethod
-    @abstractmethod
-    def code_before_amount(cls) -> bool:
-        """The position of the currency code."""
-        pass
+    def __new__(cls, value: float):
+        return float.__new__(cls, value)
+
+    def __init__(self, value: float) -> None:
+        self.amount = self._round_amount(value)
 
-    @property
     @classmethod
-    @abstractmethod
-    def delimiter(cls) -> bool:
+    def _round_amount(cls, value: float) -> int:
         """
-        Delimiter used to distinguish between the currency and it's minor unit.
+        Rounds the value to the minor unit and returns it as an integer amount
+        in the minor unit. Raises a `ValueError` for non-finite values.
         """
-        pass
+        if not math.isfinite(value):
+            raise ValueError(f"{value} is not a valid amount of money")
+        if abs(value) < cls._exact_limit:
+            # Rounding to the minor unit first yields the same (correctly
+            # rounded) result as formatting the value with `minor_unit`
+            # decimal places.
+            return int(round(round(value, cls.minor_unit) * cls._scale))
+        # Beyond the float precision the multiplication isn't exact anymore
+        # thus the decimal representation is used.
+        normalized = "{1:.{0}f}".format(cls.minor_unit, value)
+        return int(normalized.replace(".", ""))
 
-    @property
     @classmethod
-    @abstractmethod
-    def thousands_separator(cls) -> str:
+    def from_scaled(
+            cls,
+            amount: int,
+            value: Optional[float] = None,
+    ) -> "Money":
         """
-        Separator used to group thousands.
+        Creates an instance from an amount given in the minor unit (e.g. cents
+        for Euro). As the amount is already an integer the rounding done by
+        the constructor is skipped. The float value of the instance defaults
+        to the amount in the major unit, pass `value` to keep the original
+        (unrounded) value as the constructor does.
         """
-        pass
-
-    def __new__(cls, value: float):
-        return float.__new__(cls, value)
-
-    def __init__(self, value: float) -> None:
-        normalized = "{1:.{0}f}".format(self.minor_unit, value)
-        self.amount = int(normalized.replace(".", ""))
+        if value is None:
+            value = amount / cls._scale
+        rsl = float.__new__(cls, value)
+        rsl.amount = amount
+        return rsl
 
     @classmethod
     def validate(cls, value: float):
+        # Instances of the currency are already rounded.
+        if isinstance(value, cls):
+            return value
         return cls(value)
 
+    @classmethod
+    def bulk_validate(cls, values: Iterable[float]) -> List["Money"]:
+        """
+        Validates a whole column of values at once. The result is the same as
+        calling `validate` for each value but the currency settings are only
+        resolved once and the constructor is bypassed.
+        """
+        from_scaled = cls.from_scaled
+        round_amount = cls._round_amount
+        return [
+            value if isinstance(value, cls)
+            else from_scaled(round_amount(value), value)
+            for value in values
+        ]
+
     @classmethod
     def __get_validators__(cls):
         yield cls.validate
 
     @classmethod
     def number_format(cls) -> str:
-        """Returns the Excel number format code for the currency."""
+        """
+        Returns the Excel number format code for the currency. The result is
+        cached on the currency class.
+        """
+        if (rsl := cls.__dict__.get("_number_format_cached")) is not None:
+            return rsl
         # Defines how to display the thousands and minors of a number.
         # Ex.: `#,##0,00`
-        decimal_seperation = "#{}{}0.{}".format(
-            cls.delimiter,
-            "#" * cls.minor_unit,
-            "0" * cls.minor_unit,
-        )
+        decimal_seperation = \
+            f"#{cls.delimiter}{'#' * cls.minor_unit}0.{'0' * cls.minor_unit}"
         if cls.code_before_amount:
-            amount = "{} {}".format(cls.code, decimal_seperation)
+            amount = f"{cls.code} {decimal_seperation}"
         else:
-            amount = "{} {}".format(decimal_seperation, cls.code)
-        rsl = "{};[RED]-{}".format(amount, amount)
+            amount = f"{decimal_seperation} {cls.code}"
+        rsl = f"{amount};[RED]-{amount}"
+        cls._number_format_cached = rsl
         return rsl
 
     def __str__(self) -> str:
-        minor_amount = self.amount % (10 ** self.minor_unit)
-        minor = "{1:0{0}d}".format(self.minor_unit, minor_amount)
-        integer_amount = self.amount - minor_amount
-        integer_thousands = "{:,}".format(integer_amount)
-        integer = integer_thousands.replace(",", self.thousands_separator)
-
-        number = "{}{}{}".format(integer, self.delimiter, minor)
+        integer_amount, minor_amount = divmod(abs(self.amount), self._scale)
+        integer = f"{integer_amount:,}"
+        if self.thousands_separator != ",":
+            integer = integer.translate(self._thousands_trans)
+        minor = self._minor_fmt.format(minor_amount)
+        sign = "-" if self.amount < 0 else ""
+
+        number = f"{sign}{integer}{self.delimiter}{minor}"
         if self.code_before_amount:
-            return "{} {}".format(self.code, number)
-        return "{} {}".format(number, self.code)
+            return f"{self.code} {number}"
+        return f"{number} {self.code}"
 
     def __repr__(self) -> str:
         return self.__str__()
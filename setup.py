@@ -18,8 +18,9 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.8",
     packages=["pydantic_xlsx"],
+    zip_safe=False,
     install_requires=[
         "openpyxl==3.0.7",
         "pydantic==1.8.2",